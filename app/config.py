@@ -1,6 +1,7 @@
 # app/config.py
 import json
 import logging
+import os
 import re
 import sys
 from collections import namedtuple
@@ -28,6 +29,20 @@ class AppConfig:
     # Path to the external user configuration file (kept next to the main executable/script)
     CONFIG_FILE = Path("config.json")
 
+    # Per-user location for state the app writes; PROJECT_ROOT may be read-only or a temporary unpack dir
+    USER_DATA_DIR = (
+        Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local") / "CryWatchdog"
+        if sys.platform == "win32"
+        else Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "CryWatchdog"
+    )
+
+    # Per-project index parse results (app/services/index_cache.py) and the resolved dark stylesheet
+    # (app/ui/stylesheet.py)
+    CACHE_DIR = USER_DATA_DIR / "cache"
+
+    # Rotating debug log (app/core/logging.py)
+    LOG_DIR = USER_DATA_DIR / "logs"
+
     # --- Tool Paths ---
     LUA_COMPILER_PATH = TOOLS_DIR / "luac55.exe"
     STYLUA_PATH = TOOLS_DIR / "stylua.exe"
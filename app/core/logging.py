@@ -1,77 +1,164 @@
 # app/core/logging.py
-import html
 import logging
+import threading
+import time
+from collections import deque
 from logging.handlers import RotatingFileHandler
+from typing import ClassVar
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
 
 from app.config import AppConfig, UIConfig
 
+# Text content only needs &, < and > escaped; str.translate is far cheaper than html.escape
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+class GuiFormatter(logging.Formatter):
+    """
+    Renders "HH:MM:SS - LEVEL   - message" for the log panel.
+
+    Plain records skip the generic %-style substitution over the record's __dict__, and the
+    time string is reused for every record within the same second.
+    """
+
+    def __init__(self):
+        super().__init__("%(asctime)s - %(levelname)-7s - %(message)s", datefmt="%H:%M:%S")
+        self._last_second = None
+        self._last_time_str = ""
+
+    def format(self, record):
+        if record.exc_info or record.exc_text or record.stack_info:
+            return super().format(record)
+
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_time_str = time.strftime(self.datefmt, self.converter(record.created))
+            self._last_second = second
+        # Set like Formatter.format() does; QtLogHandler.emit() reads it back
+        record.message = record.getMessage()
+        return f"{self._last_time_str} - {record.levelname:<7} - {record.message}"
+
 
 class QtLogHandler(logging.Handler):
     """
-    Custom logging handler that emits a Qt signal for every log record,
-    allowing logs to be displayed in the GUI with HTML formatting.
+    Custom logging handler that forwards log records to the GUI with HTML formatting.
+
+    Records are buffered and flushed by a timer on the GUI thread as a single signal,
+    so bursts of logging cost one text append instead of one per record.
     """
 
     class LogSignals(QObject):
         log = Signal(str)
 
-    def __init__(self):
-        super().__init__()
-        self.signals = self.LogSignals()
-
-    def emit(self, record):
-        level_map = {
+    # Opening <span> tags per level, built once at import
+    LEVEL_PREFIXES: ClassVar[dict[int, str]] = {
+        level: f'<span style="{style}">'
+        for level, style in {
             logging.DEBUG: "color: gray;",
             logging.INFO: "color: white;",
             logging.WARNING: f"color: {UIConfig.COLOR_WARNING};",
             logging.ERROR: f"color: {UIConfig.COLOR_ERROR};",
             logging.CRITICAL: f"color: {UIConfig.COLOR_ERROR}; font-weight: bold;",
-        }
+        }.items()
+    }
+    DEFAULT_PREFIX = LEVEL_PREFIXES[logging.INFO]
+    DRY_RUN_PREFIX = f'<span style="color: {UIConfig.COLOR_DRY_RUN}; font-weight: bold;">'
+
+    BUFFER_SIZE = 10000
+    FLUSH_INTERVAL_MS = 33
+
+    def __init__(self):
+        super().__init__()
+        self.signals = self.LogSignals()
+        self._buffer = deque(maxlen=self.BUFFER_SIZE)
+        self._buffer_lock = threading.Lock()
+        self._dropped = 0
 
-        style = level_map.get(record.levelno, "color: white;")
-        if "[DRY RUN]" in record.getMessage():
-            style = f"color: {UIConfig.COLOR_DRY_RUN}; font-weight: bold;"
+        # Must be created on the GUI thread; the handler is constructed there in main()
+        self._flush_timer = QTimer(self.signals)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_to_gui)
+        self._flush_timer.start()
 
-        # Format just the message for the GUI
-        msg = self.format(record)
-        formatted_message = html.escape(msg)
-        self.signals.log.emit(f'<span style="{style}">{formatted_message}</span>')
+    def emit(self, record):
+        # Format just the message for the GUI; formatting also stores record.message
+        msg = self.format(record).translate(_HTML_ESCAPE_TABLE)
+
+        if "[DRY RUN]" in record.message:
+            prefix = self.DRY_RUN_PREFIX
+        else:
+            prefix = self.LEVEL_PREFIXES.get(record.levelno, self.DEFAULT_PREFIX)
+
+        with self._buffer_lock:
+            if len(self._buffer) == self.BUFFER_SIZE:
+                self._dropped += 1
+            self._buffer.append(f"{prefix}{msg}</span>")
+
+    def drain(self) -> list[str]:
+        """
+        Takes all buffered lines, prefixed with a marker if the buffer overflowed.
+        """
+        with self._buffer_lock:
+            if not self._buffer:
+                return []
+            lines = list(self._buffer)
+            self._buffer.clear()
+            dropped, self._dropped = self._dropped, 0
+
+        if dropped:
+            lines.insert(0, f"{self.LEVEL_PREFIXES[logging.DEBUG]}[... {dropped} log line(s) truncated ...]</span>")
+        return lines
+
+    @Slot()
+    def _flush_to_gui(self):
+        if lines := self.drain():
+            self.signals.log.emit("<br>".join(lines))
+
+
+# Shared by the console and file handlers
+_FILE_FORMAT = "%(asctime)s [%(levelname)s] [%(threadName)s] %(name)s: %(message)s"
 
 
 def setup_logging(qt_handler: QtLogHandler):
     """
     Configures root logger to write to:
     1. The GUI (via qt_handler)
-    2. A file (logs/app.log)
-    3. The console (stdout)
+    2. The console (stdout)
+
+    The log file is attached separately by setup_file_logging(), once the window is up.
     """
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)  # Default level
 
     # Formatters
-    file_fmt = logging.Formatter("%(asctime)s [%(levelname)s] [%(threadName)s] %(name)s: %(message)s")
-    gui_fmt = logging.Formatter("%(asctime)s - %(levelname)-7s - %(message)s", datefmt="%H:%M:%S")
+    file_fmt = logging.Formatter(_FILE_FORMAT)
+    gui_fmt = GuiFormatter()
 
     # 1. GUI Handler
     qt_handler.setFormatter(gui_fmt)
     root_logger.addHandler(qt_handler)
 
-    # 2. File Handler (Rotating)
-    log_dir = AppConfig.PROJECT_ROOT / "logs"
-    log_dir.mkdir(exist_ok=True)
-    log_file = log_dir / "debug.log"
+    # 2. Console Handler (for IDE/CMD debugging)
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(file_fmt)
+    root_logger.addHandler(console_handler)
+
+
+def setup_file_logging():
+    """
+    Adds the rotating log file (debug.log in AppConfig.LOG_DIR) to the root logger.
+
+    Opening it can stall on synced or antivirus-scanned folders, so main() defers this
+    until after the first paint.
+    """
+    AppConfig.LOG_DIR.mkdir(parents=True, exist_ok=True)
+    log_file = AppConfig.LOG_DIR / "debug.log"
 
     file_handler = RotatingFileHandler(log_file, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8")
-    file_handler.setFormatter(file_fmt)
+    file_handler.setFormatter(logging.Formatter(_FILE_FORMAT))
     # File always records DEBUG info, regardless of UI settings
     file_handler.setLevel(logging.DEBUG)
-    root_logger.addHandler(file_handler)
-
-    # 3. Console Handler (for IDE/CMD debugging)
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(file_fmt)
-    root_logger.addHandler(console_handler)
+    logging.getLogger().addHandler(file_handler)
 
     logging.info(f"Logging initialized. Log file: {log_file}")
@@ -15,3 +15,9 @@ class CoreSignals(QObject):
     criticalError = Signal(str, str)
     watcherStopped = Signal()
     progressUpdated = Signal(int, int)
+
+    def __init__(self):
+        super().__init__()
+        # Latest (current, total) published by workers, for consumers that poll on a timer
+        # instead of handling every progressUpdated emission. Tuple assignment is atomic under the GIL.
+        self.progress_state = (0, 0)
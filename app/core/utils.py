@@ -1,9 +1,15 @@
 # app/core/utils.py
 import contextlib
+import io
 import logging
 import os
+import shutil
 import stat
 import subprocess
+import tempfile
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 from xml.etree import ElementTree as ET
@@ -17,6 +23,68 @@ def normalize_path(path: Path | str) -> str:
     return path
 
 
+# os.umask() can only be read by setting it, which races with other threads creating files;
+# read it once at import, before any worker threads exist
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Perforce lookups are cached for the process lifetime: spawning p4 costs tens of ms per call.
+# _P4_OK is None until the first probe; _P4_ROOT_CACHE maps a directory to "inside the client view".
+_P4_LOCK = threading.Lock()
+_P4_OK: bool | None = None
+_P4_ROOT_CACHE: dict[str, bool] = {}
+
+
+def _run_p4(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["p4", *args],
+        capture_output=True,
+        text=True,
+        creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+    )
+
+
+def _p4_tracks_dir(directory: str) -> bool:
+    """
+    Returns True if directory is inside the Perforce client view.
+    Checks PATH and runs 'p4 info' once per process, and 'p4 where' once per directory.
+    """
+    global _P4_OK
+
+    with _P4_LOCK:
+        if _P4_OK is False:
+            return False
+        if directory in _P4_ROOT_CACHE:
+            return _P4_ROOT_CACHE[directory]
+
+        try:
+            if _P4_OK is None:
+                # A PATH lookup is far cheaper than a failed spawn on machines without p4
+                _P4_OK = shutil.which("p4") is not None and _run_p4("info").returncode == 0
+                if not _P4_OK:
+                    return False
+            proc = _run_p4("where", os.path.join(directory, "..."))
+            tracked = proc.returncode == 0 and bool(proc.stdout.strip())
+        except FileNotFoundError:
+            # P4 not installed or not in PATH
+            _P4_OK = False
+            return False
+
+        _P4_ROOT_CACHE[directory] = tracked
+        return tracked
+
+
+def _chmod_writable(file_path: Path):
+    """
+    Fallback for files outside Perforce (Git/Local): force the OS write attribute.
+    """
+    try:
+        os.chmod(file_path, stat.S_IMODE(os.stat(file_path).st_mode) | stat.S_IWRITE)
+        logging.info(f"Removed Read-Only attribute: {file_path.name}")
+    except Exception as e:
+        logging.warning(f"Failed to make {file_path.name} writable: {e}")
+
+
 def ensure_writable(file_path: Path):
     """
     Attempts to make a file writable using Perforce (P4) or OS chmod.
@@ -30,40 +98,61 @@ def ensure_writable(file_path: Path):
     if os.access(file_path, os.W_OK):
         return
 
-    # 1. Try Perforce (P4) checkout
-    try:
-        # Check if 'p4' is available and file is tracked
-        # Only run if inside a typical dev environment to avoid spamming subprocesses
-        proc = subprocess.run(
-            ["p4", "edit", str(file_path)],
-            capture_output=True,
-            text=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
-        )
-        if proc.returncode == 0:
-            logging.info(f"Checked out file via P4: {file_path.name}")
-            return
-    except FileNotFoundError:
-        pass  # P4 not installed or not in PATH
+    # 1. Try Perforce (P4) checkout, only for files under a depot
+    if _p4_tracks_dir(os.fspath(file_path.parent)):
+        try:
+            proc = _run_p4("edit", str(file_path))
+            if proc.returncode == 0:
+                logging.info(f"Checked out file via P4: {file_path.name}")
+                return
+        except FileNotFoundError:
+            pass
 
     # 2. Fallback: Force OS write attribute (Git/Local)
-    try:
-        os.chmod(file_path, stat.S_IWRITE)
-        logging.info(f"Removed Read-Only attribute: {file_path.name}")
-    except Exception as e:
-        logging.warning(f"Failed to make {file_path.name} writable: {e}")
+    _chmod_writable(file_path)
+
+
+def ensure_writable_bulk(paths: Iterable[Path]):
+    """
+    ensure_writable for many files: read-only files under a Perforce client view are opened
+    with a single 'p4 -x - edit' call (paths on stdin, so no command-line length limit),
+    then anything still read-only is chmod'ed.
+    """
+    read_only = [p for p in paths if p.exists() and not os.access(p, os.W_OK)]
+    tracked = [os.fspath(p) for p in read_only if _p4_tracks_dir(os.fspath(p.parent))]
+
+    if tracked:
+        try:
+            proc = subprocess.run(
+                ["p4", "-x", "-", "edit"],
+                input="".join(f"{p}\n" for p in tracked),
+                capture_output=True,
+                text=True,
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+            )
+            if proc.returncode != 0:
+                logging.warning(f"P4 batch edit reported errors: {proc.stderr.strip()}")
+        except FileNotFoundError:
+            pass
+        # p4 output reports depot paths, so check the local files directly
+        opened = sum(1 for p in tracked if os.access(p, os.W_OK))
+        if opened:
+            logging.info(f"Checked out {opened} file(s) via P4.")
+
+    for file_path in read_only:
+        if not os.access(file_path, os.W_OK):
+            _chmod_writable(file_path)
 
 
 def atomic_write(file_path: Path, data: Any, **kwargs: Any):
     """
     Writes data to a temp file, ensures the target is writable, then replaces it.
 
-    Includes Process ID (PID) in the temp filename to allow multiple instances
-    of the tool to run safely on the same folder without collision.
+    The temp file is created next to the target by tempfile, so its name is unique
+    per call and multiple instances of the tool can run safely on the same folder.
+    It is fsynced before the replace so a crash never leaves a truncated target.
     """
-    # Create a unique temp file name: filename.ext.<PID>.tmp
-    pid = os.getpid()
-    temp_path = file_path.with_suffix(f"{file_path.suffix}.{pid}.tmp")
+    temp_name = None
 
     try:
         # Prepare temp file
@@ -72,40 +161,112 @@ def atomic_write(file_path: Path, data: Any, **kwargs: Any):
             encoding = kwargs.get("encoding", "utf-8")
             newline = kwargs.get("newline")
 
-            # Use open() context manager to strictly control line endings
-            with open(temp_path, "w", encoding=encoding, newline=newline) as f:
-                f.write(data)
+            # Translate line endings the way open() would, then encode the whole payload once
+            # so it reaches the kernel in a single binary write
+            target_newline = os.linesep if newline is None else newline
+            if target_newline not in ("", "\n"):
+                data = data.replace("\n", target_newline)
+            data = data.encode(encoding)
 
-        elif isinstance(data, bytes):
-            temp_path.write_bytes(data)
         elif isinstance(data, ET.ElementTree):
-            data.write(str(temp_path), **kwargs)
+            # Serialize in memory so the temp file receives one contiguous write
+            buffer = io.BytesIO()
+            data.write(buffer, **kwargs)
+            data = buffer.getvalue()
+
+        if isinstance(data, bytes):
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=file_path.parent, prefix=f"{file_path.name}.", suffix=".tmp", delete=False
+            ) as tf:
+                temp_name = tf.name
+                tf.write(data)
+                # Make the contents durable before the rename can expose them
+                tf.flush()
+                os.fsync(tf.fileno())
         else:
             raise TypeError(f"Unsupported data type: {type(data)}")
 
         # Ensure target is writable (P4/Git support)
         if file_path.exists():
             ensure_writable(file_path)
+            # tempfile creates files as 0600; keep the target's permissions instead
+            shutil.copymode(file_path, temp_name)
+        else:
+            # Same mode open() would have given a new file
+            os.chmod(temp_name, 0o666 & ~_UMASK)
 
         # Atomic replace
-        os.replace(temp_path, file_path)
+        os.replace(temp_name, file_path)
 
     except Exception as e:
         logging.error(f"Atomic write to {file_path} failed: {e}")
         # Clean up temp file on failure
-        if temp_path.exists():
+        if temp_name:
             with contextlib.suppress(OSError):
-                temp_path.unlink(missing_ok=True)
+                os.unlink(temp_name)
         raise
 
 
+def _scan_dir(dir_path: str, ext_set: frozenset[str], found: list[Path], subdirs: list[str]):
+    """
+    Reads a single directory, appending matching files to found and child directories to subdirs.
+    Unreadable directories are skipped silently, matching os.walk's default behavior.
+    """
+    # Bound methods hoisted out of the per-entry loop
+    add_found = found.append
+    add_subdir = subdirs.append
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        add_subdir(entry.path)
+                    else:
+                        name = entry.name
+                        dot = name.rfind(".")
+                        if dot >= 0 and name[dot:].lower() in ext_set:
+                            add_found(Path(entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+
+
+def _walk_tree(top: str, ext_set: frozenset[str]) -> list[Path]:
+    """
+    Iteratively walks a directory tree using an explicit stack instead of recursion.
+    """
+    found = []
+    stack = [top]
+    while stack:
+        _scan_dir(stack.pop(), ext_set, found, stack)
+    return found
+
+
 def find_files_by_extensions(root_path: Path, extensions: tuple[str, ...]) -> list[Path]:
     """
     Recursively finds all files in root_path matching the given extensions.
+
+    Uses os.scandir instead of os.walk: DirEntry type checks reuse the data from the
+    directory read, so no extra stat call is made per entry. Extensions are matched on
+    the final suffix via a frozenset lookup. Top-level subdirectories are walked in a
+    thread pool, since os.scandir releases the GIL while waiting on the filesystem.
     """
-    return [
-        Path(root) / filename
-        for root, _, files in os.walk(root_path)
-        for filename in files
-        if filename.lower().endswith(extensions)
-    ]
+    ext_set = frozenset(ext.lower() if ext.startswith(".") else f".{ext.lower()}" for ext in extensions)
+    found = []
+    subdirs = []
+    _scan_dir(os.fspath(root_path), ext_set, found, subdirs)
+
+    # Not worth the thread start-up cost for shallow or narrow trees
+    if len(subdirs) < 4:
+        for subdir in subdirs:
+            found.extend(_walk_tree(subdir, ext_set))
+        return found
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(subdirs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_walk_tree, subdir, ext_set) for subdir in subdirs]
+        for future in as_completed(futures):
+            found.extend(future.result())
+
+    return found
@@ -20,6 +20,11 @@ class AssetHandler(ABC):
     def parse(file_path: Path) -> set[str]:
         pass
 
+    @staticmethod
+    @abstractmethod
+    def parse_bytes(data: bytes | mmap.mmap) -> set[str]:
+        pass
+
     @staticmethod
     @abstractmethod
     def rewrite(file_path: Path, replacements: dict[str, str], is_dir_move: bool):
@@ -41,7 +46,6 @@ class XmlAssetHandler(AssetHandler):
 
     @staticmethod
     def parse(file_path: Path) -> set[str]:
-        found_paths = set()
         if file_path.stat().st_size == 0:
             return set()
 
@@ -49,12 +53,17 @@ class XmlAssetHandler(AssetHandler):
             open(file_path, "rb") as f,
             mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
         ):
-            for match in XmlAssetHandler._BYTES_REGEX.finditer(mm):
-                try:
-                    path_str = match.group(2).decode("utf-8", errors="ignore")
-                    found_paths.add(normalize_path(path_str.strip()))
-                except Exception:
-                    continue
+            return XmlAssetHandler.parse_bytes(mm)
+
+    @staticmethod
+    def parse_bytes(data: bytes | mmap.mmap) -> set[str]:
+        found_paths = set()
+        for match in XmlAssetHandler._BYTES_REGEX.finditer(data):
+            try:
+                path_str = match.group(2).decode("utf-8", errors="ignore")
+                found_paths.add(normalize_path(path_str.strip()))
+            except Exception:
+                continue
 
         return {p.lower() for p in found_paths}
 
@@ -64,6 +73,10 @@ class XmlAssetHandler(AssetHandler):
             content = file_path.read_text(encoding="utf-8", errors="ignore")
             original_content = content
             replacements_lower = {k.lower(): v for k, v in replacements.items()}
+            if is_dir_move:
+                # Lowercase the moved directory once, not per matched reference
+                old_dir, new_dir = next(iter(replacements.items()))
+                old_dir_prefix = old_dir.lower() + "/"
 
             def replace_callback(match):
                 prefix, quote, old_path = match.groups()
@@ -72,8 +85,7 @@ class XmlAssetHandler(AssetHandler):
                 new_val = None
 
                 if is_dir_move:
-                    old_dir, new_dir = next(iter(replacements.items()))
-                    if old_path_lower.startswith(old_dir.lower() + "/"):
+                    if old_path_lower.startswith(old_dir_prefix):
                         remainder = old_path_norm[len(old_dir) :]
                         new_val = f"{new_dir}{remainder}"
                 elif old_path_lower in replacements_lower:
@@ -117,14 +129,18 @@ class LuaAssetHandler(AssetHandler):
     def parse(file_path: Path) -> set[str]:
         if file_path.stat().st_size == 0:
             return set()
-        found = set()
         with (
             open(file_path, "rb") as f,
             mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
         ):
-            for m in LuaAssetHandler._BYTES_REGEX.finditer(mm):
-                path_str = m.group(2).decode("utf-8", errors="ignore")
-                found.add(normalize_path(path_str.strip()).lower())
+            return LuaAssetHandler.parse_bytes(mm)
+
+    @staticmethod
+    def parse_bytes(data: bytes | mmap.mmap) -> set[str]:
+        found = set()
+        for m in LuaAssetHandler._BYTES_REGEX.finditer(data):
+            path_str = m.group(2).decode("utf-8", errors="ignore")
+            found.add(normalize_path(path_str.strip()).lower())
         return found
 
     @staticmethod
@@ -132,6 +148,9 @@ class LuaAssetHandler(AssetHandler):
         try:
             content = file_path.read_text(encoding="utf-8", errors="ignore")
             replacements_lower = {k.lower(): v for k, v in replacements.items()}
+            if is_dir_move:
+                old_dir, new_dir = next(iter(replacements.items()))
+                old_dir_prefix = old_dir.lower() + "/"
 
             def replacer(match: re.Match) -> str:
                 quote, path = match.group(1), match.group(2)
@@ -140,8 +159,7 @@ class LuaAssetHandler(AssetHandler):
 
                 new_path = None
                 if is_dir_move:
-                    old_dir, new_dir = next(iter(replacements.items()))
-                    if path_lower.startswith(old_dir.lower() + "/"):
+                    if path_lower.startswith(old_dir_prefix):
                         new_path = f"{new_dir}{path_norm[len(old_dir) :]}"
                 else:
                     new_path = replacements_lower.get(path_lower)
@@ -167,3 +185,11 @@ ASSET_HANDLERS = {
     ".cdf": XmlAssetHandler,
     ".lua": LuaAssetHandler,
 }
+
+
+def handler_for(path: str) -> type[AssetHandler] | None:
+    """
+    Returns the handler for a (relative) path string by extension, without building a Path.
+    """
+    dot = path.rfind(".")
+    return ASSET_HANDLERS.get(path[dot:].lower()) if dot != -1 else None
@@ -1,38 +1,85 @@
+import bisect
+import contextlib
 import logging
 import os
+import sys
 import threading
 import time
-from collections import defaultdict
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import partial
 from pathlib import Path
 
 from app.config import AppConfig
-from app.core.utils import find_files_by_extensions, normalize_path
-from app.services.asset_handlers import ASSET_HANDLERS
+from app.core.utils import ensure_writable_bulk, find_files_by_extensions, normalize_path
+from app.services import index_cache
+from app.services.asset_handlers import ASSET_HANDLERS, handler_for
 
 
-def _index_parse_worker(file_path: Path, root_path: Path) -> tuple[str | None, set[str] | None]:
+def _strip_suffix(rel_path: str) -> str:
     """
-    Worker function for the index builder.
+    String equivalent of Path(rel_path).with_suffix("") for forward-slash relative paths.
     """
-    try:
-        rel_path = normalize_path(file_path.relative_to(root_path))
-    except ValueError:
-        return None, None
+    dot = rel_path.rfind(".")
+    if dot <= rel_path.rfind("/") + 1 or dot == len(rel_path) - 1:
+        # No dot in the file name, a dotfile like '.dds', or a trailing dot: no suffix
+        return rel_path
+    return rel_path[:dot]
 
-    Handler = ASSET_HANDLERS.get(file_path.suffix.lower())
-    if not Handler:
-        return None, None
 
-    for _ in range(10):
+def _read_container_bytes(file_path: Path) -> bytes | None:
+    """
+    Reads a container, retrying with exponential backoff while it is locked, missing or
+    still empty mid-write. Returns None if it never becomes readable.
+    """
+    delay = 0.002
+    for _ in range(8):
+        with contextlib.suppress(OSError):
+            if data := file_path.read_bytes():
+                return data
+        time.sleep(delay)
+        delay = min(delay * 2, 0.1)
+    return None
+
+
+# Joins a container's references into one string for the trip back from the worker:
+# pickling one str is much cheaper than a set of thousands. Paths cannot contain NUL.
+_REFS_SEP = "\0"
+
+
+def _index_parse_batch(
+    jobs: list[tuple[Path, bytes | None]], root_path: Path
+) -> list[tuple[str, str | None, bytes | None]]:
+    """
+    Parses a batch of containers in one task, so only one pickle round-trip is paid per batch.
+    Each job carries the cached content digest, if any; a file whose content still matches
+    it is returned with refs=None instead of being parsed again. Refs come back joined by _REFS_SEP.
+    """
+    results = []
+    for file_path, cached_digest in jobs:
+        try:
+            rel_path = normalize_path(file_path.relative_to(root_path))
+        except ValueError:
+            continue
+        Handler = handler_for(file_path.name)
+        if not Handler:
+            continue
+
+        # One read serves both the digest check and the parse
+        data = _read_container_bytes(file_path)
+        if data is None:
+            continue
+        digest = index_cache.bytes_digest(data)
+        if digest == cached_digest:
+            results.append((rel_path, None, digest))
+            continue
+
         try:
-            if file_path.exists() and file_path.stat().st_size > 0:
-                return rel_path, Handler.parse(file_path)
-        except (OSError, ValueError):
-            pass
-        time.sleep(0.05)
-    return rel_path, None
+            found_refs = Handler.parse_bytes(data)
+        except ValueError:
+            # Unparseable content
+            continue
+        results.append((rel_path, _REFS_SEP.join(found_refs), digest))
+    return results
 
 
 class AssetReferenceIndex:
@@ -40,21 +87,147 @@ class AssetReferenceIndex:
     In-memory bidirectional index of asset references.
     """
 
-    def __init__(self, root_path: Path, signals, **kwargs: bool):
+    __slots__ = (
+        "_digests",
+        "_lock",
+        "_pool",
+        "_rewrite_lock",
+        "_root_prefix",
+        "_root_str",
+        "_sorted_refs",
+        "_stamps",
+        "_write_cooldowns",
+        "allow_dir_change",
+        "container_to_references",
+        "dry_run",
+        "match_any_texture_extension",
+        "reference_to_containers",
+        "root_path",
+        "signals",
+    )
+
+    # Rebuilds with at most this many files to parse stay in-process: spawning workers and pickling
+    # results back costs more than parsing a handful of files, whose reads and hashing release the GIL
+    IN_PROCESS_PARSE_LIMIT = 64
+
+    def __init__(
+        self,
+        root_path: Path,
+        signals,
+        pool: ProcessPoolExecutor | None = None,
+        rewrite_lock: "threading.Lock | None" = None,
+        **kwargs: bool,
+    ):
         self.root_path = root_path
         self.signals = signals
+        # Long-lived parse pool owned by the caller; without one, each build spins up its own
+        self._pool = pool
+        # Held while container files are being written, so the owner can wait for a patch to land
+        self._rewrite_lock = rewrite_lock or threading.Lock()
         self.dry_run = kwargs.get("dry_run", False)
         self.match_any_texture_extension = kwargs.get("match_any_texture_extension", True)
         self.allow_dir_change = kwargs.get("allow_dir_change", True)
 
         self._lock = threading.Lock()
         self._write_cooldowns = {}
-        self.reference_to_containers = defaultdict(set)
-        self.container_to_references = defaultdict(set)
+        # Root with a trailing separator, for building container paths by concatenation;
+        # the normcase'd copy is for prefix-slicing event paths in _to_rel_path
+        self._root_str = os.path.join(os.fspath(root_path), "")
+        self._root_prefix = os.path.normcase(self._root_str)
+        # Reference strings are lowercase everywhere: AssetHandler.parse returns them lowercased and
+        # rename variants are lowercased on insertion, so lookups and prefix scans never re-lower them.
+        self.reference_to_containers: dict[str, set[str]] = {}
+        # Values are frozensets, replaced wholesale on change, so cached parse results are shared as-is
+        self.container_to_references: dict[str, frozenset[str]] = {}
+        # Sorted keys of reference_to_containers, for bisect range queries by directory prefix.
+        # Only mutate reference keys through _ref_set/_drop_ref/_pop_ref to keep it in sync.
+        self._sorted_refs: list[str] = []
+        # Container rel path -> (mtime_ns, size) at its last parse, to skip no-op modify events
+        self._stamps: dict[str, tuple[int, int]] = {}
+        # Container rel path -> content digest at its last parse, to skip saves that change nothing
+        self._digests: dict[str, bytes] = {}
 
     def is_on_cooldown(self, abs_path: Path) -> bool:
         return time.time() < self._write_cooldowns.get(abs_path, 0)
 
+    def _to_rel_path(self, abs_path: Path | str) -> str | None:
+        """
+        Returns the forward-slash path relative to the project root, or None if outside it.
+        """
+        path_str = os.fspath(abs_path)
+        if not os.path.normcase(path_str).startswith(self._root_prefix):
+            return None
+        return path_str[len(self._root_prefix) :].replace("\\", "/")
+
+    def _ref_set(self, ref: str) -> set[str]:
+        """
+        Returns the container set for ref, registering a new key if needed.
+        """
+        containers = self.reference_to_containers.get(ref)
+        if containers is None:
+            containers = self.reference_to_containers[ref] = set()
+            bisect.insort(self._sorted_refs, ref)
+        return containers
+
+    def _pop_ref(self, ref: str) -> set[str] | None:
+        containers = self.reference_to_containers.pop(ref, None)
+        if containers is not None:
+            i = bisect.bisect_left(self._sorted_refs, ref)
+            if i < len(self._sorted_refs) and self._sorted_refs[i] == ref:
+                del self._sorted_refs[i]
+        return containers
+
+    def _drop_ref(self, ref: str, container: str):
+        """
+        Unlinks container from ref, deleting the key once no container references it.
+        """
+        containers = self.reference_to_containers.get(ref)
+        if containers is not None:
+            containers.discard(container)
+            if not containers:
+                self._pop_ref(ref)
+
+    def _refs_under(self, dir_prefix: str) -> list[str]:
+        """
+        Returns all reference keys starting with dir_prefix (lowercase, ending in '/').
+        """
+        lo = bisect.bisect_left(self._sorted_refs, dir_prefix)
+        # '0' is the character right after '/', so this bounds every key with the prefix
+        hi = bisect.bisect_left(self._sorted_refs, dir_prefix[:-1] + "0", lo)
+        return self._sorted_refs[lo:hi]
+
+    def _rewrite_containers(self, container_rel_paths, replacements: dict[str, str], is_dir_move: bool):
+        """
+        Patches the given containers concurrently and puts them on write cooldown.
+        Threads rather than processes: the work is mostly file I/O and the handlers log per file.
+        """
+        jobs = []
+        for rel_path_str in container_rel_paths:
+            Handler = handler_for(rel_path_str)
+            if Handler:
+                jobs.append((rel_path_str, Handler, Path(self._root_str + rel_path_str)))
+
+        if self.dry_run:
+            label = "Would patch (Dir Move)" if is_dir_move else "Would patch"
+            for rel_path_str, _, _ in jobs:
+                logging.info(f"  [DRY RUN] {label}: {rel_path_str}")
+            return
+        if not jobs:
+            return
+
+        with self._rewrite_lock:
+            # One P4 checkout for the whole batch instead of one 'p4 edit' per file from atomic_write
+            ensure_writable_bulk(full_path for _, _, full_path in jobs)
+
+            max_workers = min(32, (os.cpu_count() or 1) + 4, len(jobs))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for _ in executor.map(lambda job: job[1].rewrite(job[2], replacements, is_dir_move), jobs):
+                    pass
+
+        cooldown_until = time.time() + 2.0
+        for _, _, full_path in jobs:
+            self._write_cooldowns[full_path] = cooldown_until
+
     def build_index(self):
         logging.info("Building asset reference index...")
         container_files = find_files_by_extensions(self.root_path, tuple(ASSET_HANDLERS.keys()))
@@ -63,9 +236,62 @@ class AssetReferenceIndex:
             logging.warning("No container files found. Index is empty.")
             return
 
-        with ProcessPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
-            worker_func = partial(_index_parse_worker, root_path=self.root_path)
-            parsed_results = [r for r in executor.map(worker_func, container_files) if r and r[0] and r[1] is not None]
+        # Reuse cached parse results for containers whose mtime and size are unchanged; the rest
+        # go to the workers, which still skip the parse if the content digest matches the cache
+        cached = index_cache.load(self.root_path)
+        cache_entries: index_cache.CacheEntries = {}
+        parsed_results = []
+        stale_files = []
+        stale_stamps = {}
+        for file_path in container_files:
+            rel_path = self._to_rel_path(file_path)
+            try:
+                st = file_path.stat()
+            except OSError:
+                continue
+            entry = cached.get(rel_path)
+            if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                cache_entries[rel_path] = entry
+                parsed_results.append((rel_path, entry[3]))
+            else:
+                # A size change means different content, so there is no digest worth comparing
+                same_size = entry is not None and entry[1] == st.st_size
+                stale_files.append((st.st_size, file_path, entry[2] if same_size else None))
+                stale_stamps[rel_path] = (st.st_mtime_ns, st.st_size)
+
+        if cached:
+            logging.info(f"Index cache: {len(parsed_results)} file(s) unchanged, {len(stale_files)} to re-check.")
+
+        if stale_files:
+            max_workers = os.cpu_count() or 1
+            batch_size = max(32, len(stale_files) // (max_workers * 8))
+            # Largest files first, dealt round-robin, so batches carry similar amounts of work
+            # and no worker is left chewing on a cluster of big files at the end
+            stale_files.sort(key=lambda job: job[0], reverse=True)
+            jobs = [(file_path, digest) for _, file_path, digest in stale_files]
+            batch_count = -(-len(jobs) // batch_size)
+            batches = [jobs[i::batch_count] for i in range(batch_count)]
+
+            if len(jobs) <= self.IN_PROCESS_PARSE_LIMIT:
+                pool = ThreadPoolExecutor(max_workers=batch_count)
+            elif self._pool:
+                pool = contextlib.nullcontext(self._pool)
+            else:
+                pool = ProcessPoolExecutor(max_workers=max_workers)
+            with pool as executor:
+                worker_func = partial(_index_parse_batch, root_path=self.root_path)
+                for batch in executor.map(worker_func, batches):
+                    for container_rel_path, found_refs, digest in batch:
+                        # refs=None: touched but unchanged, so the cached parse still holds. Fresh results are
+                        # interned: the same reference arrives as a separate string from every container
+                        # that mentions it, and these sets are held for the whole session.
+                        if found_refs is None:
+                            found_refs = cached[container_rel_path][3]
+                        else:
+                            found_refs = frozenset(map(sys.intern, found_refs.split(_REFS_SEP) if found_refs else ()))
+                        parsed_results.append((container_rel_path, found_refs))
+                        if stamp := stale_stamps.get(container_rel_path):
+                            cache_entries[container_rel_path] = (*stamp, digest, found_refs)
 
         with self._lock:
             self.reference_to_containers.clear()
@@ -73,149 +299,203 @@ class AssetReferenceIndex:
             for container_rel_path, found_refs in parsed_results:
                 self.container_to_references[container_rel_path] = found_refs
                 for ref in found_refs:
-                    self.reference_to_containers[ref].add(container_rel_path)
+                    self.reference_to_containers.setdefault(ref, set()).add(container_rel_path)
+            self._sorted_refs = sorted(self.reference_to_containers)
+            self._stamps = {rel: (entry[0], entry[1]) for rel, entry in cache_entries.items()}
+            self._digests = {rel: entry[2] for rel, entry in cache_entries.items() if entry[2] is not None}
 
+        index_cache.save(self.root_path, cache_entries)
         logging.info(f"Index built. Tracking references in {len(self.container_to_references)} files.")
 
     def process_container_file(self, container_abs_path: Path):
         if self.is_on_cooldown(container_abs_path):
             return
+        container_rel_path = self._to_rel_path(container_abs_path)
+        if container_rel_path is None:
+            return
+        Handler = handler_for(container_rel_path)
+        if not Handler:
+            return
+
+        # Metadata-only touches and duplicate events leave mtime and size unchanged
+        stamp = None
+        with contextlib.suppress(OSError):
+            st = container_abs_path.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+            if self._stamps.get(container_rel_path) == stamp:
+                return
 
-        result = _index_parse_worker(container_abs_path, self.root_path)
-        if not result or not result[0]:
+        # Read once: the same bytes are hashed and, if the content really changed, parsed
+        data = _read_container_bytes(container_abs_path)
+        if data is None:
+            return
+        if stamp is not None:
+            self._stamps[container_rel_path] = stamp
+        digest = index_cache.bytes_digest(data)
+        if self._digests.get(container_rel_path) == digest:
+            return
+        try:
+            found_refs = frozenset(map(sys.intern, Handler.parse_bytes(data)))
+        except ValueError:
             return
+        self._digests[container_rel_path] = digest
 
-        container_rel_path, found_refs = result
-        if found_refs is None:
+        # Diff against the previous parse outside the lock; a save usually touches few references
+        old_refs = self.container_to_references.get(container_rel_path)
+        if old_refs == found_refs:
             return
+        added = found_refs - old_refs if old_refs else found_refs
+        removed = old_refs - found_refs if old_refs else ()
 
         with self._lock:
-            if container_rel_path in self.container_to_references:
-                for old_ref in self.container_to_references[container_rel_path]:
-                    if self.reference_to_containers.get(old_ref):
-                        self.reference_to_containers[old_ref].discard(container_rel_path)
-                        if not self.reference_to_containers[old_ref]:
-                            del self.reference_to_containers[old_ref]
-
+            for ref in removed:
+                self._drop_ref(ref, container_rel_path)
+            for ref in added:
+                self._ref_set(ref).add(container_rel_path)
             self.container_to_references[container_rel_path] = found_refs
-            for ref in found_refs:
-                self.reference_to_containers[ref].add(container_rel_path)
 
     def remove_container_from_index(self, container_abs_path: Path):
         if self.is_on_cooldown(container_abs_path):
             return
-        try:
-            container_rel_path = normalize_path(container_abs_path.relative_to(self.root_path))
-        except ValueError:
+        container_rel_path = self._to_rel_path(container_abs_path)
+        if container_rel_path is None:
             return
 
         with self._lock:
+            self._stamps.pop(container_rel_path, None)
+            self._digests.pop(container_rel_path, None)
             if container_rel_path in self.container_to_references:
                 old_refs = self.container_to_references.pop(container_rel_path, set())
                 for ref in old_refs:
-                    if self.reference_to_containers.get(ref):
-                        self.reference_to_containers[ref].discard(container_rel_path)
+                    self._drop_ref(ref, container_rel_path)
+
+    def rekey_container(self, old_abs_path: Path, new_abs_path: Path):
+        """
+        Moves a renamed container's entry to its new path. The content did not change,
+        so its references are carried over instead of being re-parsed.
+        """
+        old_rel_path = self._to_rel_path(old_abs_path)
+        new_rel_path = self._to_rel_path(new_abs_path)
+        if old_rel_path is None or new_rel_path is None:
+            return
+        if handler_for(new_rel_path) is not handler_for(old_rel_path):
+            # Renamed into another format, or out of the container formats: a delete plus an add
+            self.remove_container_from_index(old_abs_path)
+            self.process_container_file(new_abs_path)
+            return
+
+        with self._lock:
+            refs = self.container_to_references.pop(old_rel_path, None)
+            stamp = self._stamps.pop(old_rel_path, None)
+            digest = self._digests.pop(old_rel_path, None)
+            if refs is not None:
+                # The rename may have replaced a container that was already indexed
+                for ref in self.container_to_references.pop(new_rel_path, ()):
+                    self._drop_ref(ref, new_rel_path)
+                self.container_to_references[new_rel_path] = refs
+                for ref in refs:
+                    containers = self._ref_set(ref)
+                    containers.discard(old_rel_path)
+                    containers.add(new_rel_path)
+                if stamp is not None:
+                    self._stamps[new_rel_path] = stamp
+                if digest is not None:
+                    self._digests[new_rel_path] = digest
+
+        if refs is None:
+            # Never indexed under the old name (e.g. unparseable at the time): parse it now
+            self.process_container_file(new_abs_path)
 
     def update_asset_path(self, old_abs_path: Path, new_abs_path: Path):
-        try:
-            old_rel_path = normalize_path(old_abs_path.relative_to(self.root_path))
-            new_rel_path = normalize_path(new_abs_path.relative_to(self.root_path))
-        except ValueError:
+        old_rel_path = self._to_rel_path(old_abs_path)
+        new_rel_path = self._to_rel_path(new_abs_path)
+        if old_rel_path is None or new_rel_path is None:
             return
 
         replacements = {}
         old_variants = set()
         new_variants = set()
 
-        is_texture = old_abs_path.suffix.lower() in AppConfig.TEXTURE_EXTENSIONS
+        old_suffix = old_abs_path.suffix.lower()
+        is_texture = old_suffix in AppConfig.TEXTURE_EXTENSIONS
+        # Stems are sliced off the rel path strings; both are already forward-slash normalized
+        old_stem = _strip_suffix(old_rel_path)
+        new_stem = _strip_suffix(new_rel_path)
         if self.match_any_texture_extension and is_texture:
-            old_stem = normalize_path(Path(old_rel_path).with_suffix(""))
-            new_stem = normalize_path(Path(new_rel_path).with_suffix(""))
+            old_stem_lower = old_stem.lower()
+            new_stem_lower = new_stem.lower()
             for ext in AppConfig.TEXTURE_EXTENSIONS:
-                old_v = f"{old_stem}{ext}"
-                new_v = f"{new_stem}{ext}"
-                old_variants.add(old_v.lower())
-                new_variants.add(new_v.lower())
-                replacements[old_v] = new_v
+                ext_lower = ext.lower()
+                old_variants.add(old_stem_lower + ext_lower)
+                new_variants.add(new_stem_lower + ext_lower)
+                replacements[old_stem + ext] = new_stem + ext
         else:
             old_variants.add(old_rel_path.lower())
             new_variants.add(new_rel_path.lower())
             replacements[old_rel_path] = new_rel_path
 
-        if old_abs_path.suffix.lower() == ".mtl":
-            old_no_ext = normalize_path(Path(old_rel_path).with_suffix(""))
-            new_no_ext = normalize_path(Path(new_rel_path).with_suffix(""))
-            old_variants.add(old_no_ext.lower())
-            new_variants.add(new_no_ext.lower())
-            replacements[old_no_ext] = new_no_ext
+        if old_suffix == ".mtl":
+            old_variants.add(old_stem.lower())
+            new_variants.add(new_stem.lower())
+            replacements[old_stem] = new_stem
 
         with self._lock:
             affected_containers = set()
             for v in old_variants:
-                if v in self.reference_to_containers:
-                    affected_containers.update(self.reference_to_containers[v])
+                if containers := self.reference_to_containers.get(v):
+                    affected_containers.update(containers)
 
-            if not affected_containers:
-                return
+        if not affected_containers:
+            return
+
+        old_variants = frozenset(old_variants)
+        new_variants = frozenset(new_variants)
 
-            logging.info(
-                f"Rename detected: '{old_rel_path}' -> '{new_rel_path}'. Patching {len(affected_containers)} file(s)..."
-            )
-
-            for rel_path_str in affected_containers:
-                Handler = ASSET_HANDLERS.get(Path(rel_path_str).suffix.lower())
-                if Handler:
-                    full_path = self.root_path / rel_path_str
-                    if self.dry_run:
-                        logging.info(f"  [DRY RUN] Would patch: {rel_path_str}")
-                    else:
-                        Handler.rewrite(full_path, replacements, is_dir_move=False)
-                        self._write_cooldowns[full_path] = time.time() + 2.0
-
-            # Update In-Memory Index
+        logging.info(
+            f"Rename detected: '{old_rel_path}' -> '{new_rel_path}'. Patching {len(affected_containers)} file(s)..."
+        )
+
+        # Rewrites only touch files, not index state, so the lock is not held while they run
+        self._rewrite_containers(affected_containers, replacements, is_dir_move=False)
+
+        with self._lock:
+            # Update In-Memory Index: gather every container of the old keys once, then
+            # attach the union to each new key instead of re-merging per old/new pair
+            moved = set()
             for old_v in old_variants:
-                if old_v in self.reference_to_containers:
-                    containers_to_move = self.reference_to_containers.pop(old_v)
-                    for new_v in new_variants:
-                        self.reference_to_containers[new_v].update(containers_to_move)
+                if (containers := self._pop_ref(old_v)) is not None:
+                    moved |= containers
+            if moved:
+                for new_v in new_variants:
+                    self._ref_set(new_v).update(moved)
 
             for container in affected_containers:
-                if container in self.container_to_references:
-                    self.container_to_references[container] -= old_variants
-                    self.container_to_references[container].update(new_variants)
+                if (refs := self.container_to_references.get(container)) is not None:
+                    self.container_to_references[container] = (refs - old_variants) | new_variants
 
     def handle_directory_move(self, old_dir_abs: Path, new_dir_abs: Path):
         if not self.allow_dir_change:
             return
-        try:
-            old_dir_rel = normalize_path(old_dir_abs.relative_to(self.root_path))
-            new_dir_rel = normalize_path(new_dir_abs.relative_to(self.root_path))
-        except ValueError:
+        old_dir_rel = self._to_rel_path(old_dir_abs)
+        new_dir_rel = self._to_rel_path(new_dir_abs)
+        if old_dir_rel is None or new_dir_rel is None:
             return
 
         with self._lock:
-            prefix = old_dir_rel.lower() + "/"
-            affected_containers = {
-                c for c, refs in self.container_to_references.items() if any(r.lower().startswith(prefix) for r in refs)
-            }
+            # Range query over the sorted reference keys instead of scanning every container's refs
+            affected_containers = set()
+            for ref in self._refs_under(old_dir_rel.lower() + "/"):
+                affected_containers.update(self.reference_to_containers[ref])
 
-            if not affected_containers:
-                return
+        if not affected_containers:
+            return
+
+        logging.info(
+            f"Directory rename: '{old_dir_rel}' -> '{new_dir_rel}'. Patching {len(affected_containers)} files..."
+        )
 
-            logging.info(
-                f"Directory rename: '{old_dir_rel}' -> '{new_dir_rel}'. Patching {len(affected_containers)} files..."
-            )
-
-            replacements = {old_dir_rel: new_dir_rel}
-            for rel_path_str in affected_containers:
-                Handler = ASSET_HANDLERS.get(Path(rel_path_str).suffix.lower())
-                if Handler:
-                    full_path = self.root_path / rel_path_str
-                    if self.dry_run:
-                        logging.info(f"  [DRY RUN] Would patch (Dir Move): {rel_path_str}")
-                    else:
-                        Handler.rewrite(full_path, replacements, is_dir_move=True)
-                        self._write_cooldowns[full_path] = time.time() + 2.0
+        replacements = {old_dir_rel: new_dir_rel}
+        self._rewrite_containers(affected_containers, replacements, is_dir_move=True)
 
         self.signals.indexingStarted.emit()
         self.build_index()
@@ -0,0 +1,68 @@
+# app/services/index_cache.py
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+
+from app.config import AppConfig
+from app.core.utils import atomic_write
+from app.services.asset_handlers import ASSET_HANDLERS
+
+# Bump whenever the entry layout or the handlers' parse output changes
+CACHE_VERSION = 2
+
+# Container rel path -> (mtime_ns, size, content digest, parsed references).
+# mtime+size is the fast check; the digest catches files that were touched but not changed.
+CacheEntries = dict[str, tuple[int, int, bytes | None, frozenset[str]]]
+
+
+def _cache_file(root_path: Path) -> Path:
+    digest = hashlib.sha1(os.path.normcase(os.fspath(root_path)).encode("utf-8")).hexdigest()[:16]
+    return AppConfig.CACHE_DIR / f"index_{digest}.pickle"
+
+
+def bytes_digest(data: bytes) -> bytes:
+    """
+    Returns a short content hash of a container's bytes, as stored in the cache entries.
+    """
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+def _signature() -> tuple:
+    """
+    Everything that affects what the handlers' parse() returns; a mismatch discards the cache.
+    """
+    handlers = tuple(sorted((ext, handler.__name__) for ext, handler in ASSET_HANDLERS.items()))
+    return CACHE_VERSION, handlers, tuple(AppConfig.TRACKED_ASSET_EXTENSIONS)
+
+
+def load(root_path: Path) -> CacheEntries:
+    """
+    Returns the cached parse results for a project, or an empty dict if missing or stale.
+    """
+    try:
+        with open(_cache_file(root_path), "rb") as f:
+            data = pickle.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logging.debug(f"Ignoring unreadable index cache: {e}")
+        return {}
+
+    if not isinstance(data, dict) or data.get("signature") != _signature():
+        return {}
+    return data["entries"]
+
+
+def save(root_path: Path, entries: CacheEntries):
+    """
+    Replaces the cached parse results for a project.
+    """
+    cache_file = _cache_file(root_path)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        payload = pickle.dumps({"signature": _signature(), "entries": entries}, protocol=pickle.HIGHEST_PROTOCOL)
+        atomic_write(cache_file, payload)
+    except Exception as e:
+        logging.warning(f"Failed to save index cache: {e}")
@@ -1,8 +1,11 @@
 # app/services/watcher.py
 import difflib
 import logging
+import os
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import TypedDict
 
@@ -25,10 +28,24 @@ class WatcherSettings(TypedDict):
 
 
 class WatcherService:
+    __slots__ = ("rewrite_lock", "settings", "signals", "stop_event", "thread")
+
+    # watchfiles only yields a batch once no new event has arrived for this long, so the
+    # burst of events an editor fires per save is coalesced before any file is re-parsed
+    QUIET_PERIOD_MS = 200
+    # A delete only pairs with a later add as a rename within this window; the cap bounds
+    # memory when a bulk delete is never followed by matching adds
+    RENAME_WINDOW_S = 1.0
+    MAX_PENDING_DELETES = 4096
+    # How long exiting waits for a rename patch that is still writing files
+    REWRITE_DRAIN_TIMEOUT_S = 5.0
+
     def __init__(self, settings: WatcherSettings, signals):
         self.settings = settings
         self.signals = signals
         self.stop_event = threading.Event()
+        # Shared with the index, which holds it while rewriting containers
+        self.rewrite_lock = threading.Lock()
         self.thread = None
 
     def start(self):
@@ -41,14 +58,26 @@ class WatcherService:
     def stop(self):
         self.stop_event.set()
 
+    def hold_rewrites(self, timeout: float = REWRITE_DRAIN_TIMEOUT_S) -> bool:
+        """
+        Waits for an in-flight container rewrite, then keeps new ones from starting.
+        Meant for right before the process exits; False if a rewrite was still running.
+        """
+        return self.rewrite_lock.acquire(timeout=timeout)
+
     def is_alive(self) -> bool:
         return self.thread is not None and self.thread.is_alive()
 
     def _run(self):
+        # One parse pool for the whole session: directory moves rebuild the index, and
+        # respawning worker processes each time costs far more than the parsing itself
+        pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
         try:
             self.signals.indexingStarted.emit()
             options = self.settings.get("watcher_options", {})
-            index = AssetReferenceIndex(self.settings["project_root"], self.signals, **options)
+            index = AssetReferenceIndex(
+                self.settings["project_root"], self.signals, pool=pool, rewrite_lock=self.rewrite_lock, **options
+            )
             index.build_index()
 
             if self.stop_event.is_set():
@@ -58,11 +87,14 @@ class WatcherService:
             mode_str = "[DRY RUN ENABLED]" if options.get("dry_run") else "[LIVE MODE]"
             logging.info(f"Watchfiles started on: {self.settings['project_root']} {mode_str}")
 
-            container_exts = tuple(ASSET_HANDLERS.keys())
-            tracked_exts = AppConfig.TRACKED_ASSET_EXTENSIONS
-            _last_deleted = []  # list of (path, time)
+            # Sets for O(1) per-event suffix checks (the tracked list has ~20 entries)
+            container_exts = frozenset(ASSET_HANDLERS)
+            tracked_exts = frozenset(AppConfig.TRACKED_ASSET_EXTENSIONS)
+            _last_deleted: OrderedDict[Path, float] = OrderedDict()  # path -> delete time, oldest first
 
-            for changes in watch(str(self.settings["project_root"]), stop_event=self.stop_event):
+            for changes in watch(
+                str(self.settings["project_root"]), step=self.QUIET_PERIOD_MS, stop_event=self.stop_event
+            ):
                 added_paths = []
                 deleted_paths = []
                 modified_paths = []
@@ -77,12 +109,16 @@ class WatcherService:
                         modified_paths.append(path)
 
                 current_time = time.time()
-                # Clean up old deleted paths (> 1.0s)
-                _last_deleted = [(p, t) for p, t in _last_deleted if current_time - t < 1.0]
+                # Clean up old deleted paths; insertion order is time order, so they sit at the front
+                while _last_deleted and current_time - next(iter(_last_deleted.values())) >= self.RENAME_WINDOW_S:
+                    _last_deleted.popitem(last=False)
 
                 # Add new deleted paths to the tracking list
                 for p in deleted_paths:
-                    _last_deleted.append((p, current_time))
+                    _last_deleted[p] = current_time
+                    _last_deleted.move_to_end(p)
+                while len(_last_deleted) > self.MAX_PENDING_DELETES:
+                    _last_deleted.popitem(last=False)
 
                 # Detect Renames
                 renames = []
@@ -90,12 +126,12 @@ class WatcherService:
                     matching_deleted = None
 
                     # 1. Try to find a deleted file with the exact same name (Move to different folder)
-                    exact_name_matches = [p for p, t in _last_deleted if p.name == added.name]
+                    exact_name_matches = [p for p in _last_deleted if p.name == added.name]
                     if len(exact_name_matches) == 1 or len(exact_name_matches) > 1:
                         matching_deleted = exact_name_matches[0]
                     else:
                         # 2. Try to find a deleted file in the same directory (Rename in same folder)
-                        candidates = [p for p, t in _last_deleted if p.parent == added.parent]
+                        candidates = [p for p in _last_deleted if p.parent == added.parent]
 
                         if len(candidates) == 1:
                             matching_deleted = candidates[0]
@@ -111,12 +147,12 @@ class WatcherService:
                             matching_deleted = best_match
                         elif len(_last_deleted) == 1 and len(added_paths) == 1:
                             # 3. Exactly 1 deleted and 1 added recently, assume rename/move
-                            matching_deleted = _last_deleted[0][0]
+                            matching_deleted = next(iter(_last_deleted))
 
                     if matching_deleted:
                         renames.append((matching_deleted, added))
                         # Remove from tracking
-                        _last_deleted = [(p, t) for p, t in _last_deleted if p != matching_deleted]
+                        del _last_deleted[matching_deleted]
                         added_paths.remove(added)
                         if matching_deleted in deleted_paths:
                             deleted_paths.remove(matching_deleted)
@@ -126,16 +162,27 @@ class WatcherService:
                     if old_path.is_dir() or new_path.is_dir() or not old_path.suffix:
                         # It might be a directory rename
                         index.handle_directory_move(old_path, new_path)
-                    elif old_path.suffix.lower() in tracked_exts:
-                        index.update_asset_path(old_path, new_path)
-
-                for path in added_paths:
-                    if path.suffix.lower() in container_exts and not index.is_on_cooldown(path):
-                        index.process_container_file(path)
-
-                for path in modified_paths:
-                    if path.suffix.lower() in container_exts and not index.is_on_cooldown(path):
-                        index.process_container_file(path)
+                    else:
+                        old_suffix = old_path.suffix.lower()
+                        if old_suffix in tracked_exts:
+                            index.update_asset_path(old_path, new_path)
+                        # Checked separately: config.json may track fewer extensions than
+                        # there are container handlers, and the new path was taken out of
+                        # added_paths above, so nothing else would re-index it
+                        if old_suffix in container_exts:
+                            # The renamed file is itself a container; move its own entry too
+                            index.rekey_container(old_path, new_path)
+
+                # A new file usually reports both added and modified in one batch; parse it once.
+                # Files deleted again within the same batch are skipped instead of being retried
+                # by the parser as if they were locked.
+                deleted_in_batch = set(deleted_paths)
+                for path in dict.fromkeys(added_paths + modified_paths):
+                    if path.suffix.lower() not in container_exts or index.is_on_cooldown(path):
+                        continue
+                    if path in deleted_in_batch and not path.exists():
+                        continue
+                    index.process_container_file(path)
 
                 for path in deleted_paths:
                     if path.suffix.lower() in container_exts and not index.is_on_cooldown(path):
@@ -145,5 +192,6 @@ class WatcherService:
             logging.error(f"Critical watcher error: {e}", exc_info=True)
             self.signals.criticalError.emit("Watcher Error", f"{e}")
         finally:
+            pool.shutdown(wait=False, cancel_futures=True)
             logging.info("Watcher thread terminated.")
             self.signals.watcherStopped.emit()
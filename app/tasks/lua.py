@@ -4,6 +4,7 @@ import math
 import os
 import subprocess
 import sys
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
@@ -16,9 +17,11 @@ class LuaToolkit:
     Uses ThreadPoolExecutor for parallel processing to prevent UI freezes.
     """
 
-    def __init__(self, root: Path, signals):
+    def __init__(self, root: Path, signals, cancel: threading.Event | None = None):
         self.root = root
         self.signals = signals
+        # Set by the caller (e.g. when the dialog closes) to stop diagnostics between files
+        self.cancel = cancel or threading.Event()
         self.luac = AppConfig.LUA_COMPILER_PATH
         self.stylua = AppConfig.STYLUA_PATH
 
@@ -26,7 +29,8 @@ class LuaToolkit:
         """Helper to run a subprocess command safely with detailed logging."""
         # Log the command (truncated) for debugging
         cmd_str = " ".join(cmd[:3]) + ("..." if len(cmd) > 3 else "")
-        logging.debug(f"Running command: {cmd_str}")
+        # %-style so the message is only formatted when DEBUG is enabled; this runs once per file
+        logging.debug("Running command: %s", cmd_str)
 
         try:
             # CREATE_NO_WINDOW is needed on Windows to prevent a console window flashing
@@ -44,7 +48,7 @@ class LuaToolkit:
             output = (p.stderr or p.stdout or "").strip()
 
             if p.returncode != 0:
-                logging.debug(f"Command failed (Code {p.returncode}). Output: {output[:200]}")
+                logging.debug("Command failed (Code %d). Output: %s", p.returncode, output[:200])
 
             return p.returncode == 0, output
 
@@ -55,8 +59,11 @@ class LuaToolkit:
             logging.exception(f"Exception running command: {cmd_str}")
             return False, f"Execution Error: {e!s}"
 
-    def _check_single_file(self, file_path: Path) -> LuaFileAnalysisResult:
+    def _check_single_file(self, file_path: Path) -> LuaFileAnalysisResult | None:
         """Worker function to check a single Lua file."""
+        if self.cancel.is_set():
+            return None
+
         try:
             rel_path = file_path.relative_to(self.root).as_posix()
         except ValueError:
@@ -101,12 +108,20 @@ class LuaToolkit:
                 future_map = {executor.submit(self._check_single_file, f): f for f in files}
 
                 for i, future in enumerate(as_completed(future_map), 1):
+                    if self.cancel.is_set():
+                        for pending in future_map:
+                            pending.cancel()
+                        logging.info("Lua diagnostics cancelled.")
+                        break
+
+                    self.signals.progress_state = (i, len(files))
                     # Update progress sparingly to avoid flooding the UI signal queue
                     if i % 10 == 0 or i == len(files):
                         self.signals.progressUpdated.emit(i, len(files))
 
                     try:
-                        results.append(future.result())
+                        if (result := future.result()) is not None:
+                            results.append(result)
                     except Exception as e:
                         f_name = future_map[future]
                         logging.error(f"Thread failed for {f_name}: {e}")
@@ -150,7 +165,7 @@ class LuaToolkit:
             chunk = files[i : i + CHUNK_SIZE]
 
             self.signals.progressUpdated.emit(min(i + CHUNK_SIZE, len(files)), len(files))
-            logging.debug(f"Formatting batch {i // CHUNK_SIZE + 1}/{total_chunks}...")
+            logging.debug("Formatting batch %d/%d...", i // CHUNK_SIZE + 1, total_chunks)
 
             is_ok, msg = self._run_cmd(base_cmd + chunk)
 
@@ -77,15 +77,18 @@ class CleanerDialog(QDialog):
         warning.setStyleSheet(f"color: {UIConfig.COLOR_ERROR};")
         layout.addWidget(warning, 0, Qt.AlignmentFlag.AlignCenter)
 
+        # The widget set is fixed, so split it by type once instead of on every get_options call
+        self._check_widgets = [(k, w) for k, w in self.options_widgets.items() if isinstance(w, QCheckBox)]
+        self._combo_widgets = [(k, w) for k, w in self.options_widgets.items() if isinstance(w, QComboBox)]
+
         buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
     def get_options(self) -> dict:
-        params = {
-            k: v.isChecked() if isinstance(v, QCheckBox) else v.currentText() for k, v in self.options_widgets.items()
-        }
+        params = {k: w.isChecked() for k, w in self._check_widgets}
+        params.update((k, w.currentText()) for k, w in self._combo_widgets)
         params["normalize_encoding"] = params.pop("normalize_encoding_check")
         params["newline_type_label"] = params.pop("newline_type")
         return params
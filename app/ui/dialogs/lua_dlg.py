@@ -1,10 +1,12 @@
 # app/ui/dialogs/lua_dlg.py
-import contextlib
+import functools
+import threading
 import time
 from pathlib import Path
+from typing import ClassVar
 
-from PySide6.QtCore import Slot
-from PySide6.QtGui import QColor, QKeySequence, QShortcut
+from PySide6.QtCore import QTimer, Slot
+from PySide6.QtGui import QBrush, QColor, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QApplication,
     QDialog,
@@ -19,20 +21,44 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
-from app.config import UIConfig
+from app.config import AppConfig, UIConfig
 from app.tasks.lua import LuaToolkit
 
 
+@functools.lru_cache(maxsize=1)
+def _tool_paths() -> tuple[Path | None, Path | None]:
+    """
+    Resolves (luac, stylua), or None for a missing tool. Tool presence is static for the
+    app lifetime, so the stat calls are done once; "Rescan" clears the cache.
+    """
+    luac, stylua = AppConfig.LUA_COMPILER_PATH, AppConfig.STYLUA_PATH
+    return (luac if luac.is_file() else None, stylua if stylua.is_file() else None)
+
+
 class LuaToolkitDialog(QDialog):
+    # Display labels for LuaFileAnalysisResult.status, resolved once instead of per row
+    _STATUS_LABEL: ClassVar[dict[str, str]] = {
+        "ok": "Ok",
+        "syntax_error": "Syntax Error",
+    }
+    # Shared row brushes; Qt reference-counts brush data, so setForeground copies nothing per cell
+    _BRUSH_OK = QBrush(QColor(UIConfig.COLOR_SUCCESS))
+    _BRUSH_ERROR = QBrush(QColor(UIConfig.COLOR_ERROR))
+
     def __init__(self, parent):
         super().__init__(parent)
         self.main_window = parent
         self.setWindowTitle("Lua Tools")
         self.resize(700, 600)
         self.start_time = 0
+        self._cancel = threading.Event()
         self._init_ui()
         self._check_deps()
-        self.main_window.core_signals.progressUpdated.connect(self._update_progress)
+
+        # Diagnostics progress is polled at ~20 Hz instead of reacting to every cross-thread signal
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._update_progress)
 
     def _init_ui(self):
         layout = QVBoxLayout(self)
@@ -44,6 +70,10 @@ class LuaToolkitDialog(QDialog):
         self.lbl_stylua = QLabel("stylua: ...")
         status_layout.addWidget(self.lbl_luac)
         status_layout.addWidget(self.lbl_stylua)
+        status_layout.addStretch()
+        btn_rescan = QPushButton("Rescan")
+        btn_rescan.clicked.connect(self._rescan_deps)
+        status_layout.addWidget(btn_rescan)
         layout.addWidget(status)
 
         # Diagnostics Group
@@ -76,10 +106,9 @@ class LuaToolkitDialog(QDialog):
         layout.addWidget(grp_fmt)
 
     def _check_deps(self):
-        # Initialize toolkit just to check paths (dummy root)
-        t = LuaToolkit(Path("."), None)
-        ok_luac = t.luac.is_file()
-        ok_stylua = t.stylua.is_file()
+        luac, stylua = _tool_paths()
+        ok_luac = luac is not None
+        ok_stylua = stylua is not None
 
         self.lbl_luac.setText(f"luac: {'OK' if ok_luac else 'Missing'}")
         self.lbl_stylua.setText(f"stylua: {'OK' if ok_stylua else 'Missing'}")
@@ -87,6 +116,10 @@ class LuaToolkitDialog(QDialog):
         self.btn_diag.setEnabled(ok_luac)
         self.btn_fmt.setEnabled(ok_stylua)
 
+    def _rescan_deps(self):
+        _tool_paths.cache_clear()
+        self._check_deps()
+
     def _copy_selection(self):
         selected = self.tree.selectedItems()
         if not selected:
@@ -101,9 +134,12 @@ class LuaToolkitDialog(QDialog):
         self.tree.clear()
         self.start_time = time.time()
         self.btn_diag.setEnabled(False)
+        self.main_window.core_signals.progress_state = (0, 0)
+        self._progress_timer.start()
 
+        cancel = self._cancel = threading.Event()
         self.main_window.run_task(
-            lambda: LuaToolkit(self.main_window.project_root, self.main_window.core_signals).run_diagnostics(),
+            lambda: LuaToolkit(self.main_window.project_root, self.main_window.core_signals, cancel).run_diagnostics(),
             self._on_diag_done,
         )
 
@@ -117,25 +153,49 @@ class LuaToolkitDialog(QDialog):
                 self.main_window.on_task_done,
             )
 
-    @Slot(int, int)
-    def _update_progress(self, c, t):
+    @Slot()
+    def _update_progress(self):
+        c, t = self.main_window.core_signals.progress_state
         if self.isVisible() and not self.btn_diag.isEnabled():
             self.lbl_prog.setText(f"{c}/{t} | Time: {time.time() - self.start_time:.1f}s")
 
     @Slot(object)
     def _on_diag_done(self, results):
+        self._update_progress()
+        self._progress_timer.stop()
         self.btn_diag.setEnabled(True)
         if not isinstance(results, list):
             return
 
+        items = []
         for r in results:
-            c = UIConfig.COLOR_SUCCESS if r.is_syntax_ok else UIConfig.COLOR_ERROR
-            item = QTreeWidgetItem([r.relative_path, r.status, r.message])
+            brush = self._BRUSH_OK if r.is_syntax_ok else self._BRUSH_ERROR
+            item = QTreeWidgetItem([r.relative_path, self._STATUS_LABEL.get(r.status, r.status), r.message])
             for i in range(3):
-                item.setForeground(i, QColor(c))
-            self.tree.addTopLevelItem(item)
+                item.setForeground(i, brush)
+            items.append(item)
+
+        # Insert in one batch: per-item inserts re-sort, re-measure columns and repaint every time
+        header = self.tree.header()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.tree.setSortingEnabled(False)
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self.tree.addTopLevelItems(items)
+        finally:
+            self.tree.setUpdatesEnabled(True)
+            self.tree.setSortingEnabled(True)
+            header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+
+    def _stop_running_task(self):
+        self._cancel.set()
+        self._progress_timer.stop()
+
+    def done(self, r):
+        # Esc and the dialog buttons end the dialog through done() without a close event
+        self._stop_running_task()
+        super().done(r)
 
     def closeEvent(self, e):
-        with contextlib.suppress(Exception):
-            self.main_window.core_signals.progressUpdated.disconnect(self._update_progress)
+        self._stop_running_task()
         super().closeEvent(e)
@@ -1,12 +1,12 @@
 # app/ui/dialogs/reports_dlg.py
 from typing import ClassVar
 
-from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
     QHBoxLayout,
     QLabel,
+    QPlainTextEdit,
     QVBoxLayout,
 )
 
@@ -39,11 +39,12 @@ class AnalysisReportDialog(QDialog):
                 lbl = QLabel(f"--- {cat} ---")
                 lbl.setFont(UIConfig.FONT_MONOSPACE)
                 v.addWidget(lbl)
-                content = QLabel(txt)
+                # QPlainTextEdit lays out large plain text far faster than a word-wrapping QLabel
+                content = QPlainTextEdit(txt)
+                content.setReadOnly(True)
                 content.setFont(UIConfig.FONT_MONOSPACE)
-                content.setAlignment(Qt.AlignmentFlag.AlignTop)
+                content.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
                 v.addWidget(content)
-                v.addStretch()
                 cols.addLayout(v)
 
         btns = QDialogButtonBox(QDialogButtonBox.Close)
@@ -23,26 +23,9 @@ from PySide6.QtWidgets import (
 from app.config import AppState, UIConfig
 from app.core.signals import CoreSignals
 from app.core.task_manager import TaskManager
-from app.services.watcher import WatcherService
-
-# Tasks
-from app.tasks.analyzer import ProjectAnalyzer
-from app.tasks.cleaner import ProjectCleaner
-from app.tasks.converter import ProjectConverter
-from app.tasks.duplicates import DuplicateFinder
-from app.tasks.finding import MissingAssetFinder, UnusedAssetFinder
-from app.tasks.texture_validator import TextureValidator
-from app.tasks.tod import TimeOfDayConverter
-
-# Dialogs
-from app.ui.dialogs.cleaner_dlg import CleanerDialog
-from app.ui.dialogs.duplicates_dlg import DuplicateFinderDialog
-from app.ui.dialogs.finding_dlg import MissingAssetsDialog, UnusedAssetsDialog
-from app.ui.dialogs.lua_dlg import LuaToolkitDialog
-from app.ui.dialogs.packer_dlg import PackerDialog
-from app.ui.dialogs.reports_dlg import AnalysisReportDialog
-from app.ui.dialogs.texture_dlg import TextureReportDialog
-from app.ui.dialogs.tod_dlg import TimeOfDayDialog
+
+# The watcher, tasks and dialogs (with watchfiles, charset_normalizer and the TOD parameter tables)
+# are imported on first use, keeping them off the startup path.
 
 
 class MainWindow(QMainWindow):
@@ -144,7 +127,8 @@ class MainWindow(QMainWindow):
         self.core_signals.indexingFinished.connect(lambda: self._set_state(AppState.WATCHING))
         self.core_signals.watcherStopped.connect(lambda: self._set_state(AppState.IDLE))
         self.core_signals.criticalError.connect(self._error)
-        self.core_signals.progressUpdated.connect(self._progress)
+        # Always emitted from worker threads; pin the type instead of letting AutoConnection resolve it per emit
+        self.core_signals.progressUpdated.connect(self._progress, Qt.ConnectionType.QueuedConnection)
         self.task_manager.stateChanged.connect(self._set_state)
 
     def _set_state(self, s):
@@ -188,6 +172,8 @@ class MainWindow(QMainWindow):
             if self.watcher_service:
                 self.watcher_service.stop()
         elif self.project_root:
+            from app.services.watcher import WatcherService
+
             opts = {k: v.isChecked() for k, v in self.opts.items()}
             self.watcher_service = WatcherService(
                 {"project_root": self.project_root, "watcher_options": opts}, self.core_signals
@@ -210,6 +196,9 @@ class MainWindow(QMainWindow):
     def _clean(self):
         if not self.can_run_task(require_project=True):
             return
+        from app.tasks.cleaner import ProjectCleaner
+        from app.ui.dialogs.cleaner_dlg import CleanerDialog
+
         dlg = CleanerDialog(self)
         if dlg.exec():
             opts = dlg.get_options()
@@ -230,11 +219,16 @@ class MainWindow(QMainWindow):
             return
         msg = "This will irreversibly rename ALL files and folders in the project to lowercase.\n\nARE YOU SURE?"
         if QMessageBox.question(self, "Confirm Conversion", msg) == QMessageBox.StandardButton.Yes:
+            from app.tasks.converter import ProjectConverter
+
             self.run_task(lambda: ProjectConverter(self.project_root, self.core_signals).run(), self.on_task_done)
 
     def _dupes(self):
         if not self.can_run_task(require_project=False):
             return
+        from app.tasks.duplicates import DuplicateFinder
+        from app.ui.dialogs.duplicates_dlg import DuplicateFinderDialog
+
         dlg = DuplicateFinderDialog(self)
         if self.project_root:
             dlg.target_selector.set_path(self.project_root)
@@ -246,6 +240,9 @@ class MainWindow(QMainWindow):
     def _tod(self):
         if not self.can_run_task(require_project=False):
             return
+        from app.tasks.tod import TimeOfDayConverter
+        from app.ui.dialogs.tod_dlg import TimeOfDayDialog
+
         dlg = TimeOfDayDialog(self)
         if dlg.exec():
             f = dlg.get_file()
@@ -254,11 +251,15 @@ class MainWindow(QMainWindow):
     def _analyze(self):
         if not self.can_run_task(require_project=True):
             return
+        from app.tasks.analyzer import ProjectAnalyzer
+
         self.run_task(lambda: ProjectAnalyzer(self.project_root).run(), self._analyze_done)
 
     def _analyze_done(self, res):
         if not res:
             return
+        from app.ui.dialogs.reports_dlg import AnalysisReportDialog
+
         prep = defaultdict(str)
         if "extensions_counter" in res:
             for ext, count in res["extensions_counter"].items():
@@ -269,6 +270,9 @@ class MainWindow(QMainWindow):
     def _validate_textures(self):
         if not self.can_run_task(require_project=True):
             return
+        from app.tasks.texture_validator import TextureValidator
+        from app.ui.dialogs.texture_dlg import TextureReportDialog
+
         self.run_task(
             lambda: TextureValidator(self.project_root, self.core_signals).run(),
             lambda r: TextureReportDialog(self, r).exec(),
@@ -277,6 +281,9 @@ class MainWindow(QMainWindow):
     def _unused(self):
         if not self.can_run_task(require_project=True):
             return
+        from app.tasks.finding import UnusedAssetFinder
+        from app.ui.dialogs.finding_dlg import UnusedAssetsDialog
+
         self.run_task(
             lambda: UnusedAssetFinder(self.project_root, self.core_signals).run(),
             lambda r: UnusedAssetsDialog(self, r).exec(),
@@ -285,6 +292,9 @@ class MainWindow(QMainWindow):
     def _missing(self):
         if not self.can_run_task(require_project=True):
             return
+        from app.tasks.finding import MissingAssetFinder
+        from app.ui.dialogs.finding_dlg import MissingAssetsDialog
+
         self.run_task(
             lambda: MissingAssetFinder(self.project_root, self.core_signals).run(),
             lambda r: MissingAssetsDialog(self, r).exec(),
@@ -293,11 +303,15 @@ class MainWindow(QMainWindow):
     def _pack(self):
         if not self.can_run_task(require_project=False):
             return
+        from app.ui.dialogs.packer_dlg import PackerDialog
+
         PackerDialog(self).exec()
 
     def _lua(self):
         if not self.can_run_task(require_project=True):
             return
+        from app.ui.dialogs.lua_dlg import LuaToolkitDialog
+
         LuaToolkitDialog(self).exec()
 
     # --- Slots ---
@@ -0,0 +1,53 @@
+# app/ui/stylesheet.py
+import logging
+from pathlib import Path
+
+import PySide6
+import qdarkstyle
+from PySide6.QtGui import QColor, QPalette
+from PySide6.QtWidgets import QApplication
+
+from app.config import AppConfig
+from app.core.utils import atomic_write
+
+# load_stylesheet() serves its icons from a compiled Qt resource module (imported through qtpy);
+# the same images ship as plain files inside the package
+_RESOURCE_PREFIX = ":/qss_icons/dark/rc/"
+_ICON_DIR = (Path(qdarkstyle.__file__).parent / "dark" / "rc").as_posix() + "/"
+
+
+def _cache_file() -> Path:
+    return AppConfig.CACHE_DIR / f"qdark-{qdarkstyle.__version__}-{PySide6.__version__}.qss"
+
+
+def load_dark_stylesheet(app: QApplication) -> str:
+    """
+    Returns qdarkstyle's QSS for app, reusing a copy cached for these library versions.
+
+    The cached copy points its icons at the files on disk, so a warm start skips qtpy and
+    the resource module that load_stylesheet() has to import.
+    """
+    cache_file = _cache_file()
+    try:
+        qss = cache_file.read_text(encoding="utf-8")
+    except OSError:
+        qss = None
+
+    # A cache written by an install in another location points at icons that no longer exist
+    if qss and _ICON_DIR in qss:
+        # Mirrors the palette fix load_stylesheet() applies to the application
+        palette = app.palette()
+        palette.setColor(
+            QPalette.ColorGroup.Normal, QPalette.ColorRole.Link, QColor(qdarkstyle.DarkPalette.COLOR_ACCENT_3)
+        )
+        app.setPalette(palette)
+        return qss
+
+    qss = qdarkstyle.load_stylesheet(qt_api="pyside6")
+    if Path(_ICON_DIR).is_dir():
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(cache_file, qss.replace(_RESOURCE_PREFIX, _ICON_DIR))
+        except Exception as e:
+            logging.warning(f"Failed to cache stylesheet: {e}")
+    return qss
@@ -1,4 +1,5 @@
 # app/ui/widgets.py
+import os
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -31,15 +32,31 @@ class PathSelector(QWidget):
 
         self.button.clicked.connect(self._select_path)
 
+    @staticmethod
+    def _dialog_options() -> QFileDialog.Option:
+        """
+        Skips per-directory custom icon lookups, which make dialogs slow on large folders.
+        Set CRYWATCHDOG_NATIVE_DIALOG=0 to fall back to Qt's own dialog (e.g. broken GTK pickers).
+        """
+        opts = QFileDialog.Option.DontUseCustomDirectoryIcons
+        if os.environ.get("CRYWATCHDOG_NATIVE_DIALOG") == "0":
+            opts |= QFileDialog.Option.DontUseNativeDialog
+        return opts
+
     def _select_path(self):
         """Opens a file or directory dialog based on the widget's configuration."""
         path = ""
+        opts = self._dialog_options()
         if self.is_file:
-            path, _ = QFileDialog.getOpenFileName(self, "Select File")
+            path, _ = QFileDialog.getOpenFileName(self, "Select File", options=opts)
         elif self.is_save:
-            path, _ = QFileDialog.getSaveFileName(self, "Save File As", filter="Text Files (*.txt);;All Files (*)")
+            path, _ = QFileDialog.getSaveFileName(
+                self, "Save File As", filter="Text Files (*.txt);;All Files (*)", options=opts
+            )
         else:
-            path = QFileDialog.getExistingDirectory(self, "Select Folder")
+            path = QFileDialog.getExistingDirectory(
+                self, "Select Folder", options=opts | QFileDialog.Option.ShowDirsOnly
+            )
 
         if path:
             self.path_edit.setText(path)
@@ -0,0 +1,87 @@
+@echo off
+setlocal EnableDelayedExpansion
+title CryWatchdog Build
+
+:: ============================================================================
+:: This script compiles CryWatchdog into a single executable with Nuitka.
+:: Every module is compiled and embedded in the archive, so startup no longer
+:: probes sys.path for hundreds of .py/.pyc candidates.
+::
+:: USAGE:
+::   build.bat        - Builds dist\CryWatchdog.exe using the .venv created by run.bat.
+:: ============================================================================
+
+:: --- Configuration ---
+cd /d "%~dp0"
+set "VENV_DIR=.venv"
+set "ENTRY_SCRIPT=main.py"
+set "OUTPUT_DIR=dist"
+set "TOOLS_DIR=bin"
+
+:: --- Header ---
+echo =======================================================
+echo              CryWatchdog Build
+echo =======================================================
+echo.
+
+:: --- [1/3] Verifying Environment ---
+echo [1/3] Verifying environment...
+if not exist "%VENV_DIR%\Scripts\activate.bat" (
+    set "ERROR_MESSAGE=Virtual environment not found. Run 'run.bat' once to create it."
+    goto :error
+)
+set "PATH=%CD%\%VENV_DIR%\Scripts;%PATH%"
+echo [OK] Virtual environment is active.
+echo.
+
+:: --- [2/3] Installing Build Dependencies ---
+echo [2/3] Installing build dependencies...
+pip install ".[build]"
+if !errorlevel! neq 0 (
+    set "ERROR_MESSAGE=Failed to install the build dependencies."
+    goto :error
+)
+echo [OK] Build dependencies are ready.
+echo.
+
+:: --- [3/3] Compiling ---
+:: qdarkstyle's icons are packaged so the stylesheet cache can reference them on disk.
+:: The onefile payload unpacks to a fixed per-user, per-version folder instead of a new temp
+:: folder per launch, so paths into it (like those icons) stay valid between runs.
+for /f "delims=" %%v in ('python -c "import tomllib; print(tomllib.load(open('pyproject.toml', 'rb'))['project']['version'])"') do set "APP_VERSION=%%v"
+echo [3/3] Compiling '%ENTRY_SCRIPT%'... This takes several minutes.
+python -m nuitka "%ENTRY_SCRIPT%" ^
+    --standalone --onefile ^
+    --onefile-tempdir-spec="{CACHE_DIR}/CryWatchdog/!APP_VERSION!" ^
+    --enable-plugin=pyside6 ^
+    --windows-console-mode=disable ^
+    --include-package=app ^
+    --include-package=qdarkstyle ^
+    --include-package-data=qdarkstyle ^
+    --include-data-dir=%TOOLS_DIR%=%TOOLS_DIR% ^
+    --nofollow-import-to=pytest,tests ^
+    --output-dir=%OUTPUT_DIR% ^
+    --output-filename=CryWatchdog.exe
+if !errorlevel! neq 0 (
+    set "ERROR_MESSAGE=Nuitka compilation failed. Check the output above."
+    goto :error
+)
+
+echo.
+echo =======================================================
+echo Build finished: %OUTPUT_DIR%\CryWatchdog.exe
+goto :end_success
+
+:error
+echo.
+echo !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+echo [FATAL ERROR] !ERROR_MESSAGE!
+echo !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+echo.
+pause
+exit /b 1
+
+:end_success
+endlocal
+echo Press any key to close this window.
+pause >nul
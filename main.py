@@ -1,46 +1,115 @@
 # main.py
+import faulthandler
 import logging
+import os
 import sys
-from multiprocessing import freeze_support
+import threading
 
-# --- Dependency Checks ---
-try:
-    import qdarkstyle
-    from PySide6.QtWidgets import QApplication
-except ImportError as e:
+# Dump a traceback of every thread if the interpreter dies inside native code (e.g. a crash in Qt).
+# A windowed build has no stderr to write to.
+if sys.stderr is not None:
+    faulthandler.enable()
+
+USAGE = "Usage: python main.py [--help] [--version] [Qt options]"
+
+
+def _report_missing_dependency(e: ImportError):
     # Gracefully handle missing dependencies
-    missing_lib = str(e).split("'")[-2] if "'" in str(e) else str(e)
+    # Top-level package of the module that failed to import, e.g. "PySide6" for "PySide6.QtWidgets"
+    missing_lib = (e.name or "unknown").partition(".")[0]
     error_message = (
         f"ERROR: Missing required library '{missing_lib}'.\n\n"
         "Please install all dependencies from your pyproject.toml, for example:\n"
         "pip install -e ."
     )
     print(error_message, file=sys.stderr)
+
+    # A windowed (frozen) build has no console to print to. Qt may be the missing library, and
+    # starting it just for one message box is slow anyway, so use the native dialog instead.
+    if sys.platform == "win32":
+        import ctypes
+
+        MB_ICONERROR = 0x10
+        ctypes.windll.user32.MessageBoxW(None, error_message, "Dependency Error", MB_ICONERROR)
     sys.exit(1)
 
-# Import application components after dependency check
-from app.core.logging import QtLogHandler, setup_logging
-from app.ui.main_window import MainWindow
+
+# Global exception hooks to catch crashes and log them to file/console
+# This ensures that "silent crashes" are recorded in debug.log
+def _excepthook(exctype, value, tb):
+    logging.critical("Uncaught exception", exc_info=(exctype, value, tb))
+    sys.__excepthook__(exctype, value, tb)
+
+
+def _thread_excepthook(args: threading.ExceptHookArgs):
+    # Worker threads never reach sys.excepthook
+    if args.exc_type is not SystemExit:
+        logging.critical(
+            f"Uncaught exception in thread {args.thread.name if args.thread else '?'}",
+            exc_info=(args.exc_type, args.exc_value, args.exc_traceback),
+        )
+    threading.__excepthook__(args)
+
+
+def _handle_cli_flags(argv: list[str]):
+    """
+    Answers informational flags before anything heavy (Qt, qdarkstyle, the UI) is imported.
+    """
+    if "-h" in argv or "--help" in argv:
+        print(USAGE)
+        sys.exit(0)
+    if "--version" in argv:
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            print(f"CryWatchdog {version('CryWatchdog')}")
+        except PackageNotFoundError:
+            print("CryWatchdog (not installed)")
+        sys.exit(0)
 
 
 def main():
     """
     Initializes and runs the CryWatchdog application.
     """
-    # CRITICAL: Fixes recursive process spawning on Windows when using ProcessPoolExecutor/ThreadPoolExecutor
-    # This must be the very first line in main() to prevent the application from spawning infinite copies of itself.
-    freeze_support()
+    # CRITICAL: freeze_support is required by PyInstaller/cx_Freeze on Windows to prevent ProcessPoolExecutor
+    # workers from spawning infinite copies of the application. It must stay the very first thing in main().
+    # It is a no-op otherwise, so source runs skip it and the multiprocessing import it needs.
+    if getattr(sys, "frozen", False):
+        from multiprocessing import freeze_support
+
+        freeze_support()
+
+    _handle_cli_flags(sys.argv[1:])
 
-    # Global Exception Hook to catch crashes and log them to file/console
-    # This ensures that "silent crashes" are recorded in logs/debug.log
-    def exception_hook(exctype, value, tb):
-        logging.critical("Uncaught exception", exc_info=(exctype, value, tb))
-        sys.__excepthook__(exctype, value, tb)
+    # Qt reads its environment when the library loads, so this has to happen before the first PySide6
+    # import. Font database warnings are noise for this tool. A value set by the user still wins.
+    os.environ.setdefault("QT_LOGGING_RULES", "qt.qpa.fonts=false")
 
-    sys.excepthook = exception_hook
+    # --- Dependency Checks ---
+    # The Qt stack and the UI are only imported once we know a window is actually needed
+    try:
+        from PySide6.QtCore import Qt, QTimer
+        from PySide6.QtWidgets import QApplication
 
+        from app.core.logging import QtLogHandler, setup_file_logging, setup_logging
+        from app.ui.main_window import MainWindow
+        from app.ui.stylesheet import load_dark_stylesheet
+    except ImportError as e:
+        # A broken import inside the app itself is a bug, not a missing install; keep its traceback.
+        # Anything else (a missing package, a DLL that fails to load, an outdated version lacking
+        # a name) is reported to the user.
+        if e.name == "app" or (e.name or "").startswith("app."):
+            raise
+        _report_missing_dependency(e)
+
+    sys.excepthook = _excepthook
+    threading.excepthook = _thread_excepthook
+
+    # Only honoured before the application exists; fractional scale factors are used as-is
+    # instead of being rounded and then corrected by a second layout pass.
+    QApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
     app = QApplication(sys.argv)
-    app.setStyleSheet(qdarkstyle.load_stylesheet(qt_api="pyside6"))
 
     # Create the main window instance
     main_window = MainWindow()
@@ -49,12 +118,32 @@ def main():
     log_handler = QtLogHandler()
     log_handler.signals.log.connect(main_window.append_log)
 
-    # Configure the root logger (File + Console + GUI)
+    # Configure the root logger (Console + GUI); the file handler joins after the first paint
     setup_logging(log_handler)
 
     # Show the main window and start the application event loop
     main_window.show()
-    sys.exit(app.exec())
+    QTimer.singleShot(0, setup_file_logging)
+
+    # Building the QSS takes a noticeable moment; apply it once the event loop is running so the
+    # window appears immediately and is restyled right after its first paint.
+    QTimer.singleShot(0, lambda: app.setStyleSheet(load_dark_stylesheet(app)))
+    rc = app.exec()
+
+    # Regular interpreter shutdown destroys every widget wrapper one by one and joins the watcher's
+    # parse workers, which makes closing the window feel hung. Skip it once nothing needs to finish:
+    # a running task keeps the normal exit, which waits for it, and the watcher must not be mid-way
+    # through patching files (indexing alone is safe to abandon).
+    watcher = main_window.watcher_service
+    if main_window.task_manager.pool.activeThreadCount() == 0 and (watcher is None or watcher.hold_rewrites()):
+        logging.shutdown()
+        # Both are None under pythonw and in windowed builds
+        if sys.stdout:
+            sys.stdout.flush()
+        if sys.stderr:
+            sys.stderr.flush()
+        os._exit(rc)
+    sys.exit(rc)
 
 
 if __name__ == "__main__":